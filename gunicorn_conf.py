@@ -0,0 +1,40 @@
+# Gunicorn configuration for production
+# Usage: gunicorn -c gunicorn_conf.py src.app:app
+import os
+
+
+def _available_cpus():
+    """Count the CPUs this process may run on, honouring affinity and cpuset limits"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is not available on macOS
+        return os.cpu_count() or 1
+
+
+bind = f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('FLASK_PORT', 5000)}"
+
+# Report generation is CPU-bound, so use one sync worker per usable core. A warm worker
+# holds about 50MB, so the default is capped to stay well inside the 768M container limit
+workers = int(os.getenv('GUNICORN_WORKERS', min(_available_cpus(), 4)))
+worker_class = 'sync'
+
+# Each worker also renders charts in a pool of CHART_WORKERS processes (see src/charts.py).
+# Split the CPUs between workers so the pools together do not oversubscribe them; with
+# a worker per core this is 1 and charts are rendered inside the worker itself. Capped at 7,
+# the most charts one report draws, like the default in src/charts.py
+os.environ.setdefault('CHART_WORKERS', str(min(7, max(1, _available_cpus() // workers))))
+
+timeout = 120
+
+# Import the app once in the master so every worker forks with the chart renderer already
+# warmed up; chart pools are created lazily per worker, after the fork
+preload_app = True
+
+# Recycle workers periodically to bound memory growth from long-lived processes
+max_requests = 200
+max_requests_jitter = 50
+
+# Log to stdout/stderr
+accesslog = '-'
+errorlog = '-'
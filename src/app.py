@@ -1,10 +1,11 @@
 from flask import Flask, request, send_file, jsonify
 from flask_cors import CORS
-import json
+from werkzeug.exceptions import RequestEntityTooLarge
+import io
+import orjson
 import os
 import uuid
 import logging
-import shutil
 from logging.handlers import RotatingFileHandler
 from src.charts import generate_charts_for_sightings, generate_charts_for_reportings, generate_charts
 from src.pdf_generator import create_pdf_report
@@ -35,20 +36,22 @@ app.config['OUTPUT_FOLDER'] = os.path.join(PROJECT_ROOT, app.config['OUTPUT_FOLD
 
 # Configure logging for production
 if not app.debug:
-    logs_dir = os.path.join(PROJECT_ROOT, 'logs')
-    if not os.path.exists(logs_dir):
+    # Under gunicorn several workers would rotate the same file at once, so leave
+    # logging to Flask's default stderr handler, which gunicorn's error log collects
+    if not os.getenv('SERVER_SOFTWARE', '').startswith('gunicorn/'):
+        logs_dir = os.path.join(PROJECT_ROOT, 'logs')
         os.makedirs(logs_dir, exist_ok=True)
-    
-    file_handler = RotatingFileHandler(
-        os.path.join(logs_dir, 'submission-reports.log'), 
-        maxBytes=10240000, 
-        backupCount=10
-    )
-    file_handler.setFormatter(logging.Formatter(
-        '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
-    ))
-    file_handler.setLevel(logging.INFO)
-    app.logger.addHandler(file_handler)
+        
+        file_handler = RotatingFileHandler(
+            os.path.join(logs_dir, 'submission-reports.log'), 
+            maxBytes=10240000, 
+            backupCount=10
+        )
+        file_handler.setFormatter(logging.Formatter(
+            '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
+        ))
+        file_handler.setLevel(logging.INFO)
+        app.logger.addHandler(file_handler)
     app.logger.setLevel(logging.INFO)
     app.logger.info('Flask PDF application startup')
 
@@ -76,29 +79,20 @@ def generate_reportings_report():
 
 def _generate_report(report_type):
     """Internal function to generate reports for both sightings and reportings"""
-    chart_files = []
-    pdf_path = None
+    max_content_length = app.config['MAX_CONTENT_LENGTH']
+    too_large_error = f'Request too large. Maximum {max_content_length // (1024 * 1024)}MB allowed'
     
     try:
-        # Clean output directory before generating new report
-        try:
-            if os.path.exists(app.config['OUTPUT_FOLDER']):
-                for filename in os.listdir(app.config['OUTPUT_FOLDER']):
-                    file_path = os.path.join(app.config['OUTPUT_FOLDER'], filename)
-                    try:
-                        if os.path.isfile(file_path) or os.path.islink(file_path):
-                            os.unlink(file_path)
-                        elif os.path.isdir(file_path):
-                            shutil.rmtree(file_path)
-                    except Exception as e:
-                        app.logger.warning(f'Failed to delete {file_path}: {str(e)}')
-                app.logger.info('Output directory cleaned')
-        except Exception as e:
-            app.logger.warning(f'Error cleaning output directory: {str(e)}')
+        # Reject oversized bodies before reading or parsing any of it
+        if request.content_length and request.content_length > max_content_length:
+            return jsonify({'error': too_large_error}), 413
         
         # Get JSON data from request
         if request.is_json:
-            data = request.get_json()
+            try:
+                data = orjson.loads(request.get_data(cache=False))
+            except orjson.JSONDecodeError:
+                return jsonify({'error': 'Invalid JSON data'}), 400
             if data is None:
                 return jsonify({'error': 'Invalid JSON data'}), 400
         else:
@@ -107,8 +101,8 @@ def _generate_report(report_type):
                 return jsonify({'error': 'No data provided'}), 400
             
             try:
-                data = json.load(file)
-            except json.JSONDecodeError as e:
+                data = orjson.loads(file.read())
+            except orjson.JSONDecodeError as e:
                 return jsonify({'error': f'Invalid JSON format: {str(e)}'}), 400
         
         # Validate data structure
@@ -133,52 +127,50 @@ def _generate_report(report_type):
         if not isinstance(observations, list):
             return jsonify({'error': 'Observations must be an array'}), 400
         
-        if len(observations) > 10000:
-            return jsonify({'error': 'Too many observations. Maximum 10,000 allowed'}), 400
+        max_observations = app.config['MAX_OBSERVATIONS']
+        if len(observations) > max_observations:
+            return jsonify({'error': f'Too many observations. Maximum {max_observations:,} allowed'}), 400
         
         # Generate charts based on report type
         try:
             if report_type == 'reportings':
-                chart_files, summary_data = generate_charts_for_reportings(observations, app.config['UPLOAD_FOLDER'])
+                chart_files, summary_data = generate_charts_for_reportings(observations)
             else:
-                chart_files, summary_data = generate_charts_for_sightings(observations, app.config['UPLOAD_FOLDER'])
+                chart_files, summary_data = generate_charts_for_sightings(observations)
         except Exception as e:
             return jsonify({'error': f'Chart generation failed: {str(e)}'}), 500
         
         if not chart_files:
             return jsonify({'error': 'No charts generated. Please check your data contains valid fields'}), 400
         
-        # Create PDF with unique UUID filename
-        report_uuid = str(uuid.uuid4())
-        pdf_filename = f'{report_uuid}.pdf'
-        pdf_path = os.path.join(app.config['OUTPUT_FOLDER'], pdf_filename)
+        # Create PDF with unique UUID filename, rendered in memory and streamed straight back
+        pdf_filename = f'{uuid.uuid4()}.pdf'
+        pdf_buffer = io.BytesIO()
         
         try:
-            create_pdf_report(chart_files, pdf_path, observations, summary_data, report_type)
+            create_pdf_report(chart_files, pdf_buffer, observations, summary_data, report_type)
         except Exception as e:
             return jsonify({'error': f'PDF generation failed: {str(e)}'}), 500
         
         # Verify PDF was created
-        if not os.path.exists(pdf_path):
+        if not pdf_buffer.getbuffer().nbytes:
             return jsonify({'error': 'PDF file was not created'}), 500
         
-        return send_file(pdf_path, as_attachment=True, download_name=pdf_filename, mimetype='application/pdf')
+        pdf_buffer.seek(0)
+        return send_file(pdf_buffer, as_attachment=True, download_name=pdf_filename, mimetype='application/pdf')
+    
+    except RequestEntityTooLarge:
+        # Bodies without a Content-Length are cut off by Werkzeug while being read
+        return jsonify({'error': too_large_error}), 413
     
     except Exception as e:
         app.logger.error(f'Unexpected error in generate_report: {str(e)}')
         return jsonify({'error': 'An unexpected error occurred. Please try again later'}), 500
-    
-    finally:
-        # Clean up chart images in finally block to ensure cleanup happens
-        for chart_file in chart_files:
-            try:
-                if os.path.exists(chart_file):
-                    os.remove(chart_file)
-            except Exception as e:
-                app.logger.warning(f'Failed to delete chart file {chart_file}: {str(e)}')
+
 
 if __name__ == '__main__':
-    # Use environment variables for production
+    # Local development server only - production runs under gunicorn (see gunicorn_conf.py).
+    # The interactive debugger stays off unless explicitly enabled, since host defaults to all interfaces
     debug_mode = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
     port = int(os.getenv('FLASK_PORT', 5000))
     host = os.getenv('FLASK_HOST', '0.0.0.0')
@@ -1,489 +1,435 @@
-import matplotlib
-matplotlib.use('Agg')  # Use non-GUI backend - must be before pyplot import
-import matplotlib.pyplot as plt
-import seaborn as sns
-from collections import Counter
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import partial
+from itertools import chain
+import io
 import os
-import gc
+import threading
+from src import fast_barchart
 
-# Set style
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (8, 5)  # Reduced for memory optimization
-plt.rcParams['figure.max_open_warning'] = 0
-plt.rcParams['agg.path.chunksize'] = 10000
+# 'pillow' (default) draws charts directly; 'matplotlib' is kept as a fallback renderer
+CHART_RENDERER = os.getenv('CHART_RENDERER', 'pillow').lower()
 
-def generate_charts_for_sightings(observations, output_folder):
-    """Generate all charts for sightings and return list of file paths with summary data"""
-    chart_files = []
-    summary_data = []
-    
-    # Validate inputs
-    if not observations:
-        raise ValueError("No observations provided")
-    
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder, exist_ok=True)
+# Charts are rendered in worker processes; one pool is shared by all requests
+CHART_WORKERS = int(os.getenv('CHART_WORKERS', min(7, os.cpu_count() or 1)))
+_executor = None
+# Guards creating, submitting to and discarding the pool when a threaded server shares it
+_executor_lock = threading.RLock()
+
+# Both aggregate types carry the monthly/block/district counts shared by both reports
+SightingsAggregates = namedtuple('SightingsAggregates', [
+    'monthly_counts', 'block_counts', 'district_counts', 'water_body_counts',
+    'weather_counts', 'threat_counts', 'age_groups'
+])
+
+ReportingsAggregates = namedtuple('ReportingsAggregates', [
+    'monthly_counts', 'block_counts', 'district_counts', 'species_counts',
+    'status_counts', 'cause_counts', 'age_groups'
+])
+
+# Reporting species records hold stranded/injured/dead counts per age group
+REPORTING_AGE_GROUPS = (
+    ('adult', 'Adult'),
+    ('adultMale', 'Adult Male'),
+    ('adultFemale', 'Adult Female'),
+    ('subAdult', 'Sub-Adult'),
+)
+
+
+# A category chart drawn from one aggregates field; "{noun}" in title and ylabel
+# is replaced with the report's plural noun, and options go to _chart_spec
+ChartSpec = namedtuple('ChartSpec', [
+    'field', 'filename', 'summary_title', 'title', 'xlabel', 'ylabel', 'options'
+])
+
+# Block and district charts are shared by both report types
+_LOCATION_CHARTS = (
+    ChartSpec('block_counts', 'chart_blocks.png', 'Block Summary',
+              '{noun} by Block', 'Block', 'Number of {noun}', {}),
+    ChartSpec('district_counts', 'chart_districts.png', 'District Summary',
+              '{noun} by District', 'District', 'Number of {noun}', {'color': 'steelblue'}),
+)
+
+# Charts follow the monthly frequency chart in this order
+SIGHTINGS_CHARTS = _LOCATION_CHARTS + (
+    ChartSpec('water_body_counts', 'chart_waterbodies.png', 'Water Body Type Summary',
+              'Sightings by Water Body Type', 'Water Body Type', 'Number of Sightings', {'color': 'teal'}),
+    ChartSpec('weather_counts', 'chart_weather.png', 'Weather Condition Summary',
+              'Sightings by Weather Condition', 'Weather Condition', 'Number of Sightings', {'color': 'coral'}),
+    ChartSpec('threat_counts', 'chart_threats.png', 'Threats Summary',
+              'Distribution of Threats', 'Threat Type', 'Frequency', {'color': 'indianred'}),
+    ChartSpec('age_groups', 'chart_agegroups.png', 'Age Group Summary',
+              'Age Group Distribution', 'Age Group', 'Count', {'color': 'mediumseagreen', 'rotate': False}),
+)
+
+REPORTINGS_CHARTS = _LOCATION_CHARTS + (
+    ChartSpec('species_counts', 'chart_species.png', 'Species Summary',
+              'Reportings by Species', 'Species', 'Number of Reportings', {'color': 'teal'}),
+    ChartSpec('status_counts', 'chart_status.png', 'Status Summary',
+              'Animals by Status', 'Status', 'Count', {'color': 'coral', 'rotate': False}),
+    ChartSpec('cause_counts', 'chart_causes.png', 'Causes Summary',
+              'Distribution of Causes', 'Cause', 'Frequency', {'color': 'indianred'}),
+    ChartSpec('age_groups', 'chart_agegroups.png', 'Age Group Summary',
+              'Age Group Distribution', 'Age Group', 'Count', {'color': 'mediumseagreen'}),
+)
+
+
+def _aggregate_sightings(observations):
+    """Count every sightings chart category in a single pass over observations"""
+    monthly_counts = Counter()
+    block_counts = Counter()
+    district_counts = Counter()
+    # Multi-value fields are collected per observation and counted in one pass at the end
+    water_body_lists = []
+    weather_lists = []
+    threat_lists = []
+    adult = sub_adult = unidentified = 0
     
-    # 1. Monthly frequency of sightings
-    try:
-        monthly_counts = Counter()
-        for obs in observations:
-            observed_at = obs.get('observedAt')
-            if observed_at:
-                try:
-                    # Parse ISO format timestamp
-                    dt = datetime.fromisoformat(observed_at.replace('Z', '+00:00'))
-                    month_key = dt.strftime('%Y-%m')  # Format as YYYY-MM
-                    monthly_counts[month_key] += 1
-                except (ValueError, AttributeError):
-                    continue
+    for obs in observations:
+        get = obs.get
         
-        if monthly_counts:
-            # Sort by month
-            sorted_months = sorted(monthly_counts.items())
-            # Convert YYYY-MM to month names
-            month_labels = []
-            for month_str, _ in sorted_months:
-                dt = datetime.strptime(month_str, '%Y-%m')
-                month_labels.append(dt.strftime('%B %Y'))  # e.g., 'January 2025'
-            counts = [item[1] for item in sorted_months]
-            
-            fig, ax = plt.subplots(figsize=(10, 5))
-            bars = ax.bar(month_labels, counts, width=0.6, color='skyblue')
-            ax.set_xlabel('Month', fontsize=12, labelpad=15)
-            ax.set_ylabel('Number of Sightings', fontsize=12, labelpad=15)
-            ax.set_title('Monthly Sightings Frequency', fontsize=14, fontweight='bold', pad=25)
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            
-            chart_path = os.path.join(output_folder, 'chart_monthly_frequency.png')
-            plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-            plt.close(fig)
-            gc.collect()
-            chart_files.append(chart_path)
-            summary_data.append({
-                'title': 'Monthly Frequency Summary',
-                'data': sorted_months
-            })
-    except Exception as e:
-        plt.close('all')
-        print(f"Error generating monthly frequency chart: {str(e)}")
-    
-    # 2. Frequency of sightings by block
-    try:
-        blocks = [obs.get('block') for obs in observations if obs.get('block')]
-        if blocks:  # Only create chart if data exists
-            block_counts = Counter(blocks)
-            
-            fig, ax = plt.subplots(figsize=(8, 5))
-            bars = ax.bar(block_counts.keys(), block_counts.values(), width=0.4)
-            ax.set_xlabel('Block', fontsize=12, labelpad=15)
-            ax.set_ylabel('Number of Sightings', fontsize=12, labelpad=15)
-            ax.set_title('Sightings by Block', fontsize=14, fontweight='bold', pad=25)
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            
-            chart_path = os.path.join(output_folder, 'chart_blocks.png')
-            plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-            plt.close(fig)
-            gc.collect()
-            chart_files.append(chart_path)
-            summary_data.append({
-                'title': 'Block Summary',
-                'data': sorted(block_counts.items(), key=lambda x: x[1], reverse=True)
-            })
-    except Exception as e:
-        plt.close('all')
-        print(f"Error generating block chart: {str(e)}")
-    
-    # 3. Frequency of sightings by district
-    districts = [obs.get('district') for obs in observations if obs.get('district')]
-    if districts:  # Only create chart if data exists
-        district_counts = Counter(districts)
+        # The YYYY-MM month key is the timestamp prefix; the rest of the string is not validated
+        observed_at = get('observedAt')
+        if isinstance(observed_at, str) and len(observed_at) >= 7:
+            monthly_counts[observed_at[:7]] += 1
         
-        fig, ax = plt.subplots(figsize=(8, 5))
-        bars = ax.bar(district_counts.keys(), district_counts.values(), width=0.4, color='steelblue')
-        ax.set_xlabel('District', fontsize=12, labelpad=15)
-        ax.set_ylabel('Number of Sightings', fontsize=12, labelpad=15)
-        ax.set_title('Sightings by District', fontsize=14, fontweight='bold', pad=25)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        block = get('block')
+        if block:
+            block_counts[block] += 1
         
-        chart_path = os.path.join(output_folder, 'chart_districts.png')
-        plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        gc.collect()
-        chart_files.append(chart_path)
-        summary_data.append({
-            'title': 'District Summary',
-            'data': sorted(district_counts.items(), key=lambda x: x[1], reverse=True)
-        })
-    
-    # 4. Sightings by water body type
-    water_bodies = []
-    for obs in observations:
-        water_body_list = obs.get('waterBody', [])
+        district = get('district')
+        if district:
+            district_counts[district] += 1
+        
+        # Exact type checks are cheaper than isinstance in this per-observation loop
+        water_body_list = get('waterBody')
         if water_body_list:
-            if isinstance(water_body_list, list):
-                water_bodies.extend(water_body_list)
+            if type(water_body_list) is list:
+                water_body_lists.append(water_body_list)
             else:
                 # Handle legacy single string format
-                water_bodies.append(water_body_list)
-    if water_bodies:  # Only create chart if data exists
-        water_body_counts = Counter(water_bodies)
-        
-        fig, ax = plt.subplots(figsize=(8, 5))
-        bars = ax.bar(water_body_counts.keys(), water_body_counts.values(), width=0.4, color='teal')
-        ax.set_xlabel('Water Body Type', fontsize=12, labelpad=15)
-        ax.set_ylabel('Number of Sightings', fontsize=12, labelpad=15)
-        ax.set_title('Sightings by Water Body Type', fontsize=14, fontweight='bold', pad=25)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+                water_body_lists.append((water_body_list,))
         
-        chart_path = os.path.join(output_folder, 'chart_waterbodies.png')
-        plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        gc.collect()
-        chart_files.append(chart_path)
-        summary_data.append({
-            'title': 'Water Body Type Summary',
-            'data': sorted(water_body_counts.items(), key=lambda x: x[1], reverse=True)
-        })
-    
-    # 5. Sightings by weather condition
-    weather = []
-    for obs in observations:
-        weather_list = obs.get('weatherCondition', [])
+        weather_list = get('weatherCondition')
         if weather_list:
-            if isinstance(weather_list, list):
-                weather.extend(weather_list)
+            if type(weather_list) is list:
+                weather_lists.append(weather_list)
             else:
                 # Handle legacy single string format
-                weather.append(weather_list)
-    if weather:  # Only create chart if data exists
-        weather_counts = Counter(weather)
+                weather_lists.append((weather_list,))
         
-        fig, ax = plt.subplots(figsize=(8, 5))
-        bars = ax.bar(weather_counts.keys(), weather_counts.values(), width=0.4, color='coral')
-        ax.set_xlabel('Weather Condition', fontsize=12, labelpad=15)
-        ax.set_ylabel('Number of Sightings', fontsize=12, labelpad=15)
-        ax.set_title('Sightings by Weather Condition', fontsize=14, fontweight='bold', pad=25)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        threats = get('threats')
+        if threats:
+            threat_lists.append(threats)
         
-        chart_path = os.path.join(output_folder, 'chart_weather.png')
-        plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        gc.collect()
-        chart_files.append(chart_path)
-        summary_data.append({
-            'title': 'Weather Condition Summary',
-            'data': sorted(weather_counts.items(), key=lambda x: x[1], reverse=True)
-        })
+        species_list = get('species')
+        if species_list:
+            for sp in species_list:
+                sp_get = sp.get
+                adult += sp_get('adult', 0) + sp_get('adultMale', 0) + sp_get('adultFemale', 0)
+                sub_adult += sp_get('subAdult', 0)
+                unidentified += sp_get('unidentified', 0)
     
-    # 6. Distribution of threats
-    all_threats = []
-    for obs in observations:
-        threats = obs.get('threats', [])
-        if threats:
-            all_threats.extend(threats)
+    water_body_counts = Counter(chain.from_iterable(water_body_lists))
+    weather_counts = Counter(chain.from_iterable(weather_lists))
+    threat_counts = Counter(chain.from_iterable(threat_lists))
+    age_groups = {'Adult': adult, 'Sub-Adult': sub_adult, 'Unidentified': unidentified}
+    
+    return SightingsAggregates(
+        monthly_counts, block_counts, district_counts, water_body_counts,
+        weather_counts, threat_counts, age_groups
+    )
+
+
+def _aggregate_reportings(observations):
+    """Count every reportings chart category in a single pass over observations"""
+    monthly_counts = Counter()
+    block_counts = Counter()
+    district_counts = Counter()
+    species_counts = Counter()
+    # Cause lists and "Other" causes are collected in order and counted in one pass at the end
+    cause_lists = []
+    age_groups = {'Adult': 0, 'Adult Male': 0, 'Adult Female': 0, 'Sub-Adult': 0}
+    stranded = injured = dead = 0
     
-    if all_threats:  # Only create chart if data exists
-        threat_counts = Counter(all_threats)
+    for obs in observations:
+        get = obs.get
+        
+        # The YYYY-MM month key is the timestamp prefix; the rest of the string is not validated
+        observed_at = get('observedAt')
+        if isinstance(observed_at, str) and len(observed_at) >= 7:
+            monthly_counts[observed_at[:7]] += 1
         
-        fig, ax = plt.subplots(figsize=(8, 5))
-        bars = ax.bar(threat_counts.keys(), threat_counts.values(), width=0.4, color='indianred')
-        ax.set_xlabel('Threat Type', fontsize=12, labelpad=15)
-        ax.set_ylabel('Frequency', fontsize=12, labelpad=15)
-        ax.set_title('Distribution of Threats', fontsize=14, fontweight='bold', pad=25)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        block = get('block')
+        if block:
+            block_counts[block] += 1
         
-        chart_path = os.path.join(output_folder, 'chart_threats.png')
-        plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        gc.collect()
-        chart_files.append(chart_path)
-        summary_data.append({
-            'title': 'Threats Summary',
-            'data': sorted(threat_counts.items(), key=lambda x: x[1], reverse=True)
-        })
+        district = get('district')
+        if district:
+            district_counts[district] += 1
+        
+        species_list = get('species')
+        if species_list:
+            for sp in species_list:
+                sp_get = sp.get
+                species_counts[sp_get('type', 'Unknown')] += 1
+                
+                # Status and age group totals share the same per-age-group records
+                for age_key, age_label in REPORTING_AGE_GROUPS:
+                    age_data = sp_get(age_key)
+                    if type(age_data) is dict:
+                        age_get = age_data.get
+                        age_stranded = age_get('stranded', 0)
+                        age_injured = age_get('injured', 0)
+                        age_dead = age_get('dead', 0)
+                        stranded += age_stranded
+                        injured += age_injured
+                        dead += age_dead
+                        age_groups[age_label] += age_stranded + age_injured + age_dead
+        
+        for cause_item in get('causes', []):
+            causes = cause_item.get('cause', [])
+            if causes:
+                cause_lists.append(causes)
+            # Also include otherCause if present
+            other_cause = cause_item.get('otherCause')
+            if other_cause:
+                cause_lists.append((f"Other: {other_cause}",))
     
-    # 7. Age group distribution
-    age_groups = {'Adult': 0, 'Sub-Adult': 0, 'Unidentified': 0}
-    for obs in observations:
-        species = obs.get('species', [])
-        for sp in species:
-            age_groups['Adult'] += sp.get('adult', 0) + sp.get('adultMale', 0) + sp.get('adultFemale', 0)
-            age_groups['Sub-Adult'] += sp.get('subAdult', 0)
-            age_groups['Unidentified'] += sp.get('unidentified', 0)
+    cause_counts = Counter(chain.from_iterable(cause_lists))
+    status_counts = {'Stranded': stranded, 'Injured': injured, 'Dead': dead}
     
-    # Only create chart if there's data
-    if age_groups['Adult'] > 0 or age_groups['Sub-Adult'] > 0 or age_groups['Unidentified'] > 0:
-        fig, ax = plt.subplots(figsize=(8, 5))
-        bars = ax.bar(age_groups.keys(), age_groups.values(), width=0.4, color='mediumseagreen')
-        ax.set_xlabel('Age Group', fontsize=12, labelpad=15)
-        ax.set_ylabel('Count', fontsize=12, labelpad=15)
-        ax.set_title('Age Group Distribution', fontsize=14, fontweight='bold', pad=25)
-        plt.tight_layout()
-        
-        chart_path = os.path.join(output_folder, 'chart_agegroups.png')
-        plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        gc.collect()
-        chart_files.append(chart_path)
-        summary_data.append({
-            'title': 'Age Group Summary',
-            'data': sorted(age_groups.items(), key=lambda x: x[1], reverse=True)
-        })
+    return ReportingsAggregates(
+        monthly_counts, block_counts, district_counts, species_counts,
+        status_counts, cause_counts, age_groups
+    )
+
+
+def _get_executor():
+    """Return the shared chart rendering pool, creating it on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=CHART_WORKERS)
+        return _executor
+
+
+def _discard_executor(executor):
+    """Drop a broken pool so the next request starts a fresh one
     
-    return chart_files, summary_data
+    Does nothing to the shared pool if another thread has already replaced it.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    # A broken pool has already failed all of its futures, so there is nothing to cancel
+    executor.shutdown(wait=False)
 
 
-def generate_charts_for_reportings(observations, output_folder):
-    """Generate all charts for reportings and return list of file paths with summary data"""
-    chart_files = []
-    summary_data = []
+def _pool_results(specs):
+    """Render specs in the shared pool and return one result callable per spec
     
-    # Validate inputs
-    if not observations:
-        raise ValueError("No observations provided")
+    Raises BrokenProcessPool, after discarding the pool, if a pool process died
+    before the batch finished.
+    """
+    with _executor_lock:
+        executor = _get_executor()
+        try:
+            futures = [executor.submit(_render_bar_chart, spec) for spec in specs]
+        except BrokenProcessPool:
+            _discard_executor(executor)
+            raise
+    wait(futures)
+    for future in futures:
+        if isinstance(future.exception(), BrokenProcessPool):
+            _discard_executor(executor)
+            raise future.exception()
+    return [future.result for future in futures]
+
+
+def _render_bar_chart(spec):
+    """Render a single bar chart described by spec and return the PNG bytes
     
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder, exist_ok=True)
+    Runs inside a worker process, so spec must only contain picklable primitives.
+    """
+    if CHART_RENDERER == 'matplotlib':
+        # Imported lazily so the default renderer never loads matplotlib
+        from src.mpl_barchart import render_bar
+    else:
+        render_bar = fast_barchart.render_bar
+    buf = io.BytesIO()
+    render_bar(buf, **spec)
+    return buf.getvalue()
+
+
+def _chart_spec(labels, values, title, xlabel, ylabel, color=None, size=(800, 500), width=0.4, rotate=True):
+    """Build the picklable description of a bar chart consumed by _render_bar_chart"""
+    return {
+        'labels': list(labels),
+        'values': list(values),
+        'title': title,
+        'xlabel': xlabel,
+        'ylabel': ylabel,
+        'color': color,
+        'size': size,
+        'width': width,
+        'rotate': rotate,
+    }
+
+
+def _warm_up_renderer():
+    """Draw and discard a tiny chart so renderer start-up costs are paid at import
     
-    # 1. Monthly frequency of reportings
-    try:
-        monthly_counts = Counter()
-        for obs in observations:
-            observed_at = obs.get('observedAt')
-            if observed_at:
-                try:
-                    # Parse ISO format timestamp
-                    dt = datetime.fromisoformat(observed_at.replace('Z', '+00:00'))
-                    month_key = dt.strftime('%Y-%m')  # Format as YYYY-MM
-                    monthly_counts[month_key] += 1
-                except (ValueError, AttributeError):
-                    continue
-        
-        if monthly_counts:
-            # Sort by month
-            sorted_months = sorted(monthly_counts.items())
-            # Convert YYYY-MM to month names
-            month_labels = []
-            for month_str, _ in sorted_months:
-                dt = datetime.strptime(month_str, '%Y-%m')
-                month_labels.append(dt.strftime('%B %Y'))  # e.g., 'January 2025'
-            counts = [item[1] for item in sorted_months]
-            
-            fig, ax = plt.subplots(figsize=(10, 5))
-            bars = ax.bar(month_labels, counts, width=0.6, color='skyblue')
-            ax.set_xlabel('Month', fontsize=12, labelpad=15)
-            ax.set_ylabel('Number of Reportings', fontsize=12, labelpad=15)
-            ax.set_title('Monthly Reportings Frequency', fontsize=14, fontweight='bold', pad=25)
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            
-            chart_path = os.path.join(output_folder, 'chart_monthly_frequency.png')
-            plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-            plt.close(fig)
-            gc.collect()
-            chart_files.append(chart_path)
-            summary_data.append({
-                'title': 'Monthly Frequency Summary',
-                'data': sorted_months
-            })
-    except Exception as e:
-        plt.close('all')
-        print(f"Error generating monthly frequency chart: {str(e)}")
+    Loads the selected backend, its fonts and the PNG encoder once in this process;
+    chart worker processes and preloaded gunicorn workers fork from it already warm.
+    """
+    _render_bar_chart(_chart_spec(['warm-up'], [1], 'Warm-up', 'x', 'y'))
+
+
+_warm_up_renderer()
+
+
+def _render_charts(charts, output_folder=None):
+    """Render (filename, spec, summary) chart tasks, in parallel when CHART_WORKERS > 1
     
-    # 2. Frequency of reportings by block
-    try:
-        blocks = [obs.get('block') for obs in observations if obs.get('block')]
-        if blocks:
-            block_counts = Counter(blocks)
-            
-            fig, ax = plt.subplots(figsize=(8, 5))
-            bars = ax.bar(block_counts.keys(), block_counts.values(), width=0.4)
-            ax.set_xlabel('Block', fontsize=12, labelpad=15)
-            ax.set_ylabel('Number of Reportings', fontsize=12, labelpad=15)
-            ax.set_title('Reportings by Block', fontsize=14, fontweight='bold', pad=25)
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            
-            chart_path = os.path.join(output_folder, 'chart_blocks.png')
-            plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-            plt.close(fig)
-            gc.collect()
-            chart_files.append(chart_path)
-            summary_data.append({
-                'title': 'Block Summary',
-                'data': sorted(block_counts.items(), key=lambda x: x[1], reverse=True)
-            })
-    except Exception as e:
-        plt.close('all')
-        print(f"Error generating block chart: {str(e)}")
+    Returns the charts and their summary data in task order. Charts are written
+    to output_folder when one is given, otherwise they are returned as in-memory
+    PNG buffers. A chart whose data cannot be drawn is logged and left out of both lists.
+    """
+    specs = [spec for _, spec, _ in charts]
+    results = None
+    if CHART_WORKERS > 1 and len(charts) > 1:
+        try:
+            results = _pool_results(specs)
+        except BrokenProcessPool as e:
+            # A pool process was killed (OOM, segfault, timeout). The pool has been replaced
+            # for later requests; render this batch in-process so the report still succeeds
+            print(f"Chart pool broken, rendering in-process: {str(e)}")
+    if results is None:
+        # Without parallelism a worker process only adds a pickling round trip
+        results = [partial(_render_bar_chart, spec) for spec in specs]
     
-    # 3. Frequency of reportings by district
-    districts = [obs.get('district') for obs in observations if obs.get('district')]
-    if districts:
-        district_counts = Counter(districts)
-        
-        fig, ax = plt.subplots(figsize=(8, 5))
-        bars = ax.bar(district_counts.keys(), district_counts.values(), width=0.4, color='steelblue')
-        ax.set_xlabel('District', fontsize=12, labelpad=15)
-        ax.set_ylabel('Number of Reportings', fontsize=12, labelpad=15)
-        ax.set_title('Reportings by District', fontsize=14, fontweight='bold', pad=25)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+    chart_files = []
+    summary_data = []
+    # Collect in submission order so chart_files and summary_data stay aligned
+    for (filename, spec, summary), result in zip(charts, results):
+        try:
+            png = result()
+        except (KeyError, ValueError, TypeError) as e:
+            # Bad chart data only skips that chart; anything else propagates
+            print(f"Error generating {spec['title']} chart: {str(e)}")
+            continue
         
-        chart_path = os.path.join(output_folder, 'chart_districts.png')
-        plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        gc.collect()
-        chart_files.append(chart_path)
-        summary_data.append({
-            'title': 'District Summary',
-            'data': sorted(district_counts.items(), key=lambda x: x[1], reverse=True)
-        })
+        if output_folder:
+            chart_path = os.path.join(output_folder, filename)
+            with open(chart_path, 'wb') as f:
+                f.write(png)
+            chart_files.append(chart_path)
+        else:
+            chart_files.append(io.BytesIO(png))
+        summary_data.append(summary)
     
-    # 4. Species distribution
-    species_counts = Counter()
-    for obs in observations:
-        species_list = obs.get('species', [])
-        for sp in species_list:
-            species_type = sp.get('type', 'Unknown')
-            species_counts[species_type] += 1
+    return chart_files, summary_data
+
+
+def _counts_chart(filename, counts, summary_title, title, xlabel, ylabel, **options):
+    """Build the chart task for a category -> count mapping, summarised by descending count"""
+    if not isinstance(counts, Counter):
+        counts = Counter(counts)
+    spec = _chart_spec(counts.keys(), counts.values(), title, xlabel, ylabel, **options)
+    return (filename, spec, {
+        'title': summary_title,
+        'data': counts.most_common()
+    })
+
+
+def _monthly_chart(monthly_counts, noun):
+    """Build the monthly frequency chart task, or None if there is no data"""
+    # Sort by month, converting each distinct YYYY-MM key to a month name once
+    sorted_months = []
+    month_labels = []
+    for month_str, count in sorted(monthly_counts.items()):
+        try:
+            dt = datetime.strptime(month_str, '%Y-%m')
+        except ValueError:
+            # The first seven characters are not a valid year-month
+            continue
+        sorted_months.append((month_str, count))
+        month_labels.append(dt.strftime('%B %Y'))  # e.g., 'January 2025'
+    if not sorted_months:
+        return None
+    counts = [item[1] for item in sorted_months]
     
-    if species_counts:
-        fig, ax = plt.subplots(figsize=(8, 5))
-        bars = ax.bar(species_counts.keys(), species_counts.values(), width=0.4, color='teal')
-        ax.set_xlabel('Species', fontsize=12, labelpad=15)
-        ax.set_ylabel('Number of Reportings', fontsize=12, labelpad=15)
-        ax.set_title('Reportings by Species', fontsize=14, fontweight='bold', pad=25)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        
-        chart_path = os.path.join(output_folder, 'chart_species.png')
-        plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        gc.collect()
-        chart_files.append(chart_path)
-        summary_data.append({
-            'title': 'Species Summary',
-            'data': sorted(species_counts.items(), key=lambda x: x[1], reverse=True)
-        })
+    spec = _chart_spec(
+        month_labels, counts, f'Monthly {noun} Frequency', 'Month', f'Number of {noun}',
+        color='skyblue', size=(1000, 500), width=0.6
+    )
+    return ('chart_monthly_frequency.png', spec, {
+        'title': 'Monthly Frequency Summary',
+        'data': sorted_months
+    })
+
+
+def _table_charts(aggregates, chart_specs, noun):
+    """Build the chart tasks for every ChartSpec whose counts contain data
     
-    # 5. Status distribution (stranded, injured, dead)
-    status_counts = {'Stranded': 0, 'Injured': 0, 'Dead': 0}
-    for obs in observations:
-        species_list = obs.get('species', [])
-        for sp in species_list:
-            # Count all age groups
-            for age_group in ['adult', 'adultMale', 'adultFemale', 'subAdult']:
-                age_data = sp.get(age_group, {})
-                if isinstance(age_data, dict):
-                    status_counts['Stranded'] += age_data.get('stranded', 0)
-                    status_counts['Injured'] += age_data.get('injured', 0)
-                    status_counts['Dead'] += age_data.get('dead', 0)
+    noun is the plural used in titles and axis labels, e.g. 'Sightings'.
+    """
+    charts = []
+    for spec in chart_specs:
+        counts = getattr(aggregates, spec.field)
+        # Only create chart if data exists
+        if any(counts.values()):
+            charts.append(_counts_chart(
+                spec.filename, counts, spec.summary_title,
+                spec.title.format(noun=noun), spec.xlabel, spec.ylabel.format(noun=noun),
+                **spec.options
+            ))
+    return charts
+
+
+def _generate_charts(observations, output_folder, aggregate, chart_specs, noun):
+    """Aggregate observations and render the monthly chart followed by chart_specs"""
+    # Validate inputs
+    if not observations:
+        raise ValueError("No observations provided")
     
-    if any(status_counts.values()):
-        fig, ax = plt.subplots(figsize=(8, 5))
-        bars = ax.bar(status_counts.keys(), status_counts.values(), width=0.4, color='coral')
-        ax.set_xlabel('Status', fontsize=12, labelpad=15)
-        ax.set_ylabel('Count', fontsize=12, labelpad=15)
-        ax.set_title('Animals by Status', fontsize=14, fontweight='bold', pad=25)
-        plt.tight_layout()
-        
-        chart_path = os.path.join(output_folder, 'chart_status.png')
-        plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        gc.collect()
-        chart_files.append(chart_path)
-        summary_data.append({
-            'title': 'Status Summary',
-            'data': sorted(status_counts.items(), key=lambda x: x[1], reverse=True)
-        })
+    if output_folder:
+        os.makedirs(output_folder, exist_ok=True)
     
-    # 6. Causes distribution
-    all_causes = []
-    for obs in observations:
-        causes_list = obs.get('causes', [])
-        for cause_item in causes_list:
-            causes = cause_item.get('cause', [])
-            if causes:
-                all_causes.extend(causes)
-            # Also include otherCause if present
-            other_cause = cause_item.get('otherCause')
-            if other_cause:
-                all_causes.append(f"Other: {other_cause}")
+    aggregates = aggregate(observations)
     
-    if all_causes:
-        cause_counts = Counter(all_causes)
-        
-        fig, ax = plt.subplots(figsize=(8, 5))
-        bars = ax.bar(cause_counts.keys(), cause_counts.values(), width=0.4, color='indianred')
-        ax.set_xlabel('Cause', fontsize=12, labelpad=15)
-        ax.set_ylabel('Frequency', fontsize=12, labelpad=15)
-        ax.set_title('Distribution of Causes', fontsize=14, fontweight='bold', pad=25)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        
-        chart_path = os.path.join(output_folder, 'chart_causes.png')
-        plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        gc.collect()
-        chart_files.append(chart_path)
-        summary_data.append({
-            'title': 'Causes Summary',
-            'data': sorted(cause_counts.items(), key=lambda x: x[1], reverse=True)
-        })
+    charts = []
+    monthly_chart = _monthly_chart(aggregates.monthly_counts, noun)
+    if monthly_chart:
+        charts.append(monthly_chart)
+    charts.extend(_table_charts(aggregates, chart_specs, noun))
     
-    # 7. Age group distribution
-    age_groups = {'Adult': 0, 'Adult Male': 0, 'Adult Female': 0, 'Sub-Adult': 0}
-    for obs in observations:
-        species_list = obs.get('species', [])
-        for sp in species_list:
-            adult_data = sp.get('adult', {})
-            if isinstance(adult_data, dict):
-                age_groups['Adult'] += adult_data.get('stranded', 0) + adult_data.get('injured', 0) + adult_data.get('dead', 0)
-            
-            adult_male_data = sp.get('adultMale', {})
-            if isinstance(adult_male_data, dict):
-                age_groups['Adult Male'] += adult_male_data.get('stranded', 0) + adult_male_data.get('injured', 0) + adult_male_data.get('dead', 0)
-            
-            adult_female_data = sp.get('adultFemale', {})
-            if isinstance(adult_female_data, dict):
-                age_groups['Adult Female'] += adult_female_data.get('stranded', 0) + adult_female_data.get('injured', 0) + adult_female_data.get('dead', 0)
-            
-            sub_adult_data = sp.get('subAdult', {})
-            if isinstance(sub_adult_data, dict):
-                age_groups['Sub-Adult'] += sub_adult_data.get('stranded', 0) + sub_adult_data.get('injured', 0) + sub_adult_data.get('dead', 0)
+    return _render_charts(charts, output_folder)
+
+
+def generate_charts_for_sightings(observations, output_folder=None):
+    """Generate all charts for sightings and return list of charts with summary data
     
-    if any(age_groups.values()):
-        fig, ax = plt.subplots(figsize=(8, 5))
-        bars = ax.bar(age_groups.keys(), age_groups.values(), width=0.4, color='mediumseagreen')
-        ax.set_xlabel('Age Group', fontsize=12, labelpad=15)
-        ax.set_ylabel('Count', fontsize=12, labelpad=15)
-        ax.set_title('Age Group Distribution', fontsize=14, fontweight='bold', pad=25)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        
-        chart_path = os.path.join(output_folder, 'chart_agegroups.png')
-        plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        gc.collect()
-        chart_files.append(chart_path)
-        summary_data.append({
-            'title': 'Age Group Summary',
-            'data': sorted(age_groups.items(), key=lambda x: x[1], reverse=True)
-        })
+    Charts are PNG file paths inside output_folder, or in-memory PNG buffers
+    when no output_folder is given.
+    """
+    return _generate_charts(observations, output_folder, _aggregate_sightings, SIGHTINGS_CHARTS, 'Sightings')
+
+
+def generate_charts_for_reportings(observations, output_folder=None):
+    """Generate all charts for reportings and return list of charts with summary data
     
-    return chart_files, summary_data
+    Charts are PNG file paths inside output_folder, or in-memory PNG buffers
+    when no output_folder is given.
+    """
+    return _generate_charts(observations, output_folder, _aggregate_reportings, REPORTINGS_CHARTS, 'Reportings')
 
 
 # Backwards compatibility - defaults to sightings
-def generate_charts(observations, output_folder):
+def generate_charts(observations, output_folder=None):
     """Generate charts - defaults to sightings for backwards compatibility"""
     return generate_charts_for_sightings(observations, output_folder)
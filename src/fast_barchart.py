@@ -0,0 +1,153 @@
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+import math
+
+# Colors mirror the seaborn "whitegrid" style used by the matplotlib renderer
+DEFAULT_BAR_COLOR = '#1f77b4'
+TEXT_COLOR = (38, 38, 38)
+GRID_COLOR = (204, 204, 204)
+BACKGROUND_COLOR = 'white'
+
+PADDING = 10
+TITLE_PAD = 25
+LABEL_PAD = 15
+TICK_PAD = 6
+MAX_TICK_LABEL_LENGTH = 40
+
+# Charts are embedded in the PDF straight away, so favour encode speed over file size
+PNG_COMPRESS_LEVEL = 1
+
+
+def _load_font(filename, size):
+    """Load a TrueType font, falling back to Pillow's bundled font if it is not installed"""
+    try:
+        return ImageFont.truetype(filename, size)
+    except OSError:
+        return ImageFont.load_default(size)
+
+
+# Fonts are loaded once per process; sizes match 14/12/10pt text at 100 dpi
+TITLE_FONT = _load_font('DejaVuSans-Bold.ttf', 19)
+LABEL_FONT = _load_font('DejaVuSans.ttf', 17)
+TICK_FONT = _load_font('DejaVuSans.ttf', 14)
+
+
+def _text_size(text, font):
+    left, top, right, bottom = font.getbbox(text)
+    return right - left, bottom - top
+
+
+def _text_image(text, font, angle=0):
+    """Render text onto a transparent image, rotated counter-clockwise by angle degrees"""
+    left, top, right, bottom = font.getbbox(text)
+    img = Image.new('RGBA', (right - left + 2, bottom - top + 2), (255, 255, 255, 0))
+    ImageDraw.Draw(img).text((1 - left, 1 - top), text, font=font, fill=TEXT_COLOR)
+    if angle:
+        img = img.rotate(angle, expand=True, resample=Image.BICUBIC)
+    return img
+
+
+def _tick_step(axis_top):
+    """Pick a 1/2/2.5/5 x 10^n step giving roughly six y-axis ticks"""
+    raw = axis_top / 6
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for multiple in (1, 2, 2.5, 5, 10):
+        step = multiple * magnitude
+        if step >= raw:
+            break
+    # Values are counts, so fractional ticks are never useful
+    return max(step, 1)
+
+
+def _format_tick(value):
+    return str(int(value)) if float(value).is_integer() else f'{value:g}'
+
+
+def _shorten(label):
+    label = str(label)
+    if len(label) > MAX_TICK_LABEL_LENGTH:
+        return label[:MAX_TICK_LABEL_LENGTH - 1] + '…'
+    return label
+
+
+def render_bar(path, labels, values, title, xlabel, ylabel, color=None, size=(800, 500), width=0.4, rotate=True):
+    """Draw a vertical bar chart and save it as a PNG
+
+    Args:
+        path: File path or binary file-like object to write the PNG to
+        labels: Category labels, one per bar
+        values: Bar heights
+        title: Chart title
+        xlabel: X axis label
+        ylabel: Y axis label
+        color: Bar color as a CSS color name or hex string
+        size: Image size in pixels as (width, height)
+        width: Bar width as a fraction of the space available per category
+        rotate: Rotate x tick labels by 45 degrees
+    """
+    img_w, img_h = size
+    img = Image.new('RGB', size, BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(img)
+    bar_color = ImageColor.getrgb(color or DEFAULT_BAR_COLOR)
+
+    values = list(values)
+    tick_images = [_text_image(_shorten(label), TICK_FONT, 45 if rotate else 0) for label in labels]
+
+    # Y scale - leave the same 5% headroom matplotlib adds above the tallest bar
+    axis_top = max(max(values, default=0), 1) * 1.05
+    step = _tick_step(axis_top)
+    y_ticks = [i * step for i in range(int(axis_top // step) + 1)]
+    y_tick_labels = [_format_tick(tick) for tick in y_ticks]
+
+    # Margins are sized to their contents, like tight_layout
+    title_h = _text_size(title, TITLE_FONT)[1]
+    xlabel_h = _text_size(xlabel, LABEL_FONT)[1]
+    ylabel_img = _text_image(ylabel, LABEL_FONT, 90)
+    y_tick_w = max(_text_size(label, TICK_FONT)[0] for label in y_tick_labels)
+    x_tick_h = max((tick.height for tick in tick_images), default=0)
+
+    top = PADDING + title_h + TITLE_PAD
+    bottom = PADDING + xlabel_h + LABEL_PAD + x_tick_h + TICK_PAD
+    left = PADDING + ylabel_img.width + LABEL_PAD + y_tick_w + TICK_PAD
+    right = PADDING * 2
+
+    slot = (img_w - left - right) / max(len(values), 1)
+    if rotate and tick_images:
+        # Right-aligned rotated labels extend left of their bar; keep the first one on canvas
+        left = max(left, PADDING + tick_images[0].width - slot / 2)
+        slot = (img_w - left - right) / max(len(values), 1)
+
+    plot_x0, plot_y0 = left, top
+    plot_x1, plot_y1 = img_w - right, max(img_h - bottom, top + 1)
+    plot_h = plot_y1 - plot_y0
+
+    # Horizontal grid lines with their tick labels
+    for tick, tick_label in zip(y_ticks, y_tick_labels):
+        y = plot_y1 - tick / axis_top * plot_h
+        draw.line([(plot_x0, y), (plot_x1, y)], fill=GRID_COLOR, width=1)
+        draw.text((plot_x0 - TICK_PAD, y), tick_label, font=TICK_FONT, fill=TEXT_COLOR, anchor='rm')
+
+    # Bars and x tick labels
+    bar_w = slot * width
+    for i, (value, tick_image) in enumerate(zip(values, tick_images)):
+        center = plot_x0 + slot * (i + 0.5)
+        if value > 0:
+            draw.rectangle(
+                [(center - bar_w / 2, plot_y1 - value / axis_top * plot_h), (center + bar_w / 2, plot_y1)],
+                fill=bar_color
+            )
+        if rotate:
+            tick_x = center - tick_image.width
+        else:
+            tick_x = center - tick_image.width / 2
+        img.paste(tick_image, (int(max(tick_x, 0)), int(plot_y1 + TICK_PAD)), tick_image)
+
+    draw.rectangle([(plot_x0, plot_y0), (plot_x1, plot_y1)], outline=GRID_COLOR, width=1)
+
+    # Axis labels and title
+    plot_center_x = (plot_x0 + plot_x1) / 2
+    draw.text((plot_center_x, img_h - PADDING), xlabel, font=LABEL_FONT, fill=TEXT_COLOR, anchor='md')
+    img.paste(ylabel_img, (PADDING, int((plot_y0 + plot_y1 - ylabel_img.height) / 2)), ylabel_img)
+    draw.text((plot_center_x, PADDING), title, font=TITLE_FONT, fill=TEXT_COLOR, anchor='mt')
+
+    img.save(path, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
+    return path
@@ -0,0 +1,103 @@
+import matplotlib
+import threading
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Figures are built directly on an Agg canvas, so pyplot and its global figure manager are never loaded
+rcParams = matplotlib.rcParams
+
+# Set style - equivalent of seaborn's "whitegrid" without importing seaborn
+rcParams.update({
+    'figure.facecolor': 'white',
+    'axes.facecolor': 'white',
+    'axes.edgecolor': '.8',
+    'axes.labelcolor': '.15',
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'grid.color': '.8',
+    'grid.linestyle': '-',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'xtick.direction': 'out',
+    'ytick.direction': 'out',
+    'xtick.top': False,
+    'xtick.bottom': False,
+    'ytick.left': False,
+    'ytick.right': False,
+    'lines.solid_capstyle': 'round',
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+})
+
+# Shared chart text styling, so individual charts never pass font or padding options
+rcParams.update({
+    'font.size': 12,
+    'axes.titlesize': 14,
+    'axes.titleweight': 'bold',
+    'axes.titlepad': 25,
+    'axes.labelsize': 12,
+    'axes.labelpad': 15,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10,
+})
+
+# Use matplotlib's bundled font so lookups never fall back through missing families
+rcParams['font.family'] = 'DejaVu Sans'
+rcParams['svg.fonttype'] = 'none'
+
+rcParams['agg.path.chunksize'] = 10000
+
+DPI = 100
+PNG_COMPRESS_LEVEL = 1  # Same fast zlib level as src.fast_barchart
+
+# Each thread draws every chart on its own figure instead of creating a new one per chart.
+# Worker processes render on a single thread; threaded servers get one figure per thread
+_local = threading.local()
+
+
+def _make_template_axes(fig):
+    """Add the axes shared by every chart; later charts only replace bars and text
+    
+    Fonts and padding come from rcParams, fixed once here when the axes are created.
+    """
+    ax = fig.add_subplot(111)
+    ax.set_title('')
+    ax.set_xlabel('')
+    ax.set_ylabel('')
+    return ax
+
+
+def _get_figure():
+    """Return this thread's reusable figure, canvas and axes, creating them on first use"""
+    figure = getattr(_local, 'figure', None)
+    if figure is None:
+        # constrained_layout fits labels during the draw, so no tight_layout/bbox_inches pass is needed
+        fig = Figure(figsize=(8, 5), dpi=DPI, layout='constrained')
+        figure = _local.figure = (fig, FigureCanvasAgg(fig), _make_template_axes(fig))
+    return figure
+
+
+def render_bar(path, labels, values, title, xlabel, ylabel, color=None, size=(800, 500), width=0.4, rotate=True):
+    """Draw a vertical bar chart with matplotlib and save it as a PNG
+    
+    Takes the same arguments as src.fast_barchart.render_bar; size is in pixels.
+    """
+    fig, canvas, ax = _get_figure()
+    fig.set_size_inches(size[0] / DPI, size[1] / DPI)
+    
+    # Swap the previous chart's bars for this one's, rescaling to the new data only
+    for container in list(ax.containers):
+        container.remove()
+    ax.relim()
+    positions = range(len(labels))
+    ax.bar(positions, values, width=width, color=color or 'C0')
+    ax.set_xticks(positions, labels, rotation=45 if rotate else 0, ha='right' if rotate else 'center')
+    
+    # Update the template's text artists in place rather than re-applying their styling
+    ax.title.set_text(title)
+    ax.xaxis.label.set_text(xlabel)
+    ax.yaxis.label.set_text(ylabel)
+    
+    canvas.print_png(path, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+    return path
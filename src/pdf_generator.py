@@ -5,14 +5,63 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from datetime import datetime
+from functools import lru_cache
 import os
 
+
+# Every summary table shares the same layout
+_SUMMARY_COLWIDTHS = (4*inch, 2*inch)
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5aa0')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('TOPPADDING', (0, 0), (-1, 0), 10),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+])
+
+
+@lru_cache(maxsize=1)
+def _styles():
+    """Return the sample style sheet and the custom title/info styles, built once per process"""
+    styles = getSampleStyleSheet()
+    
+    # Custom styles
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=32,
+        textColor=colors.HexColor('#1f4788'),
+        spaceAfter=40,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    )
+    
+    info_style = ParagraphStyle(
+        'InfoStyle',
+        parent=styles['Normal'],
+        fontSize=14,
+        alignment=TA_CENTER,
+        spaceAfter=20
+    )
+    
+    return styles, title_style, info_style
+
+
 def create_pdf_report(chart_files, output_path, observations, summary_data=None, report_type='sightings'):
     """Create a PDF report with charts and statistics
     
     Args:
-        chart_files: List of chart file paths
-        output_path: Path to save the PDF
+        chart_files: List of chart file paths or file-like PNG buffers
+        output_path: Path or binary file-like object to write the PDF to
         observations: List of observation records
         summary_data: Summary data for tables
         report_type: Type of report - 'sightings' or 'reportings'
@@ -25,38 +74,20 @@ def create_pdf_report(chart_files, output_path, observations, summary_data=None,
     if not observations:
         raise ValueError("No observations provided")
     
-    # Verify all chart files exist
+    # Verify all chart files exist; in-memory buffers need no check
     for chart_file in chart_files:
-        if not os.path.exists(chart_file):
+        if isinstance(chart_file, str) and not os.path.exists(chart_file):
             raise FileNotFoundError(f"Chart file not found: {chart_file}")
     
     # Ensure output directory exists
-    output_dir = os.path.dirname(output_path)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir, exist_ok=True)
+    if isinstance(output_path, str):
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
     
     doc = SimpleDocTemplate(output_path, pagesize=A4)
     story = []
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=32,
-        textColor=colors.HexColor('#1f4788'),
-        spaceAfter=40,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    info_style = ParagraphStyle(
-        'InfoStyle',
-        parent=styles['Normal'],
-        fontSize=14,
-        alignment=TA_CENTER,
-        spaceAfter=20
-    )
+    styles, title_style, info_style = _styles()
     
     # === FIRST PAGE - Title Page ===
     # Add some top spacing
@@ -81,17 +112,23 @@ def create_pdf_report(chart_files, output_path, observations, summary_data=None,
     story.append(PageBreak())
     
     # === SUBSEQUENT PAGES - One chart + table per page ===
+    # Fixed-size flowables are created once per report and reused on every page.
+    # They are not shared between reports because reportlab attaches the canvas to a flowable while drawing it
+    chart_spacer = Spacer(1, 0.4*inch)
+    table_title_spacer = Spacer(1, 0.15*inch)
+    page_break = PageBreak()
+    
     for i, chart_file in enumerate(chart_files):
         # Add chart image
         img = Image(chart_file, width=6.5*inch, height=4.55*inch)
         story.append(img)
-        story.append(Spacer(1, 0.4*inch))
+        story.append(chart_spacer)
         
         # Add summary table if available
         if summary_data and i < len(summary_data):
             table_title = Paragraph(f"<b>{summary_data[i]['title']}</b>", styles['Heading3'])
             story.append(table_title)
-            story.append(Spacer(1, 0.15*inch))
+            story.append(table_title_spacer)
             
             # Create table data
             table_data = [['Category', 'Frequency']]
@@ -99,28 +136,13 @@ def create_pdf_report(chart_files, output_path, observations, summary_data=None,
                 table_data.append([str(category).replace('_', ' ').title(), str(freq)])
             
             # Create table
-            summary_table = Table(table_data, colWidths=[4*inch, 2*inch])
-            summary_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5aa0')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-                ('TOPPADDING', (0, 0), (-1, 0), 10),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-                ('TOPPADDING', (0, 1), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-            ]))
+            summary_table = Table(table_data, colWidths=_SUMMARY_COLWIDTHS)
+            summary_table.setStyle(_SUMMARY_TABLE_STYLE)
             story.append(summary_table)
         
         # Add page break after each chart-table pair (except the last one)
         if (i + 1) < len(chart_files):
-            story.append(PageBreak())
+            story.append(page_break)
     
     # Build PDF
     doc.build(story)